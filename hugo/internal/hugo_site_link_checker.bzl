@@ -32,21 +32,22 @@ if ! command -v python3 &> /dev/null; then
     exit 1
 fi
 
-# Run the link checker, capturing exit status
+# Run the link checker, capturing exit status. The external link cache lives
+# in the user's home directory, so it is disabled to keep the action hermetic.
 EXIT_CODE=0
 if [ "$CHECK_EXTERNAL" = "True" ]; then
     echo "Note: External link checking enabled - requires internet access"
-    python3 "$PROCESSOR" "$SITE_DIR" "$OUTPUT_REPORT" --check-external --timeout "$TIMEOUT" || EXIT_CODE=$?
+    python3 "$PROCESSOR" "$SITE_DIR" "$OUTPUT_REPORT" --check-external --timeout "$TIMEOUT" --no-cache || EXIT_CODE=$?
 else
     echo "Note: External link checking disabled (CI-friendly default)"
-    python3 "$PROCESSOR" "$SITE_DIR" "$OUTPUT_REPORT" --timeout "$TIMEOUT" || EXIT_CODE=$?
+    python3 "$PROCESSOR" "$SITE_DIR" "$OUTPUT_REPORT" --timeout "$TIMEOUT" --no-cache || EXIT_CODE=$?
 fi
 
 # Check for specific error conditions
 if [ $EXIT_CODE -eq 2 ]; then
     echo "ERROR: Link checker failed with configuration error"
     echo "Check that Python dependencies are installed:"
-    echo "  pip install beautifulsoup4 requests"
+    echo "  pip install lxml aiohttp"
     exit 1
 elif [ $EXIT_CODE -eq 1 ] && [ ! -f "$OUTPUT_REPORT" ]; then
     echo "ERROR: Link checker failed and no report was generated"
@@ -104,7 +105,7 @@ link_checker_hugo_site = rule(
 
     **Requirements:**
     - Python 3 must be installed and available in PATH
-    - Python packages: beautifulsoup4, requests (install with pip)
+    - Python packages: lxml, aiohttp (install with pip)
     - Internet access for external link validation (optional, disabled by default)
 
     **CI/CD Usage:**
@@ -7,17 +7,53 @@ Provides comprehensive error reporting with line numbers and file paths.
 """
 
 import argparse
+import asyncio
+import email.utils
+import itertools
 import os
 import re
+import shelve
 import sys
 import time
 import urllib.parse
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import Dict, List, Literal, Optional, Set, Tuple
 
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+import lxml.html
+from lxml import etree
+
+
+# A link found in a page: (url, line_number, context)
+LinkInfo = Tuple[str, int, str]
+
+# Patterns used on every config file or page, compiled once at import
+_BASEURL_RE = re.compile(r'baseURL\s*[:=]\s*["\']([^"\']+)["\']')
+_ID_XPATH = etree.XPath('//@id')
+_NAME_XPATH = etree.XPath('//a/@name')
+_HEADER_XPATH = etree.XPath('//h1|//h2|//h3|//h4|//h5|//h6')
+_SLUG_TRANS = str.maketrans(' ', '-')
+# Hugo writes UTF-8; parsing raw bytes skips decoding each file to str first
+_HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+# Any other URL scheme (mailto:, tel:, javascript:, ...), matched as urlparse would
+_SCHEME_RE = re.compile(r'[A-Za-z][A-Za-z0-9+.-]*:')
+
+# Concurrency caps for external checks, overall and per host
+_MAX_CONNECTIONS = 100
+_MAX_CONNECTIONS_PER_HOST = 4
+# Longest Retry-After we honour before retrying a rate-limited URL, in seconds
+_MAX_RETRY_AFTER = 60
+
+# Statuses some servers send for HEAD even though GET succeeds
+_HEAD_FALLBACK_STATUSES = frozenset({403, 405, 501})
+# Statuses that mean the server refuses automated requests, not that the link is broken
+_NON_ERROR_STATUSES = frozenset({403, 405})
+
+# Default location of the on-disk cache of healthy external URLs
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'hugo_link_checker.db')
 
 
 @dataclass
@@ -31,15 +67,218 @@ class LinkIssue:
     context: str  # Surrounding HTML context
 
 
+def parse_file(file_path: Path, site_dir: Path,
+               max_parse_bytes: int) -> Tuple[List[LinkIssue], List[LinkInfo], List[LinkInfo]]:
+    """Check links in a single HTML file.
+    
+    Runs in a worker process, so findings are returned rather than recorded.
+    Same-page anchor links are skipped, not validated; internal and external
+    links are only collected for the parent to check against the site index
+    and network.
+    Files larger than max_parse_bytes are skipped with a warning.
+    
+    Returns:
+        Tuple of (issues, internal_links, external_links) where the link
+        lists hold (url, line_number, context) tuples.
+    """
+    issues: List[LinkIssue] = []
+    internal_links: List[LinkInfo] = []
+    external_links: List[LinkInfo] = []
+    
+    try:
+        # Skip oversized files rather than building a full DOM for them
+        size = file_path.stat().st_size
+        if size > max_parse_bytes:
+            print(f"Warning: Skipping large file {file_path.relative_to(site_dir)} "
+                  f"({size} bytes > {max_parse_bytes})")
+            return issues, internal_links, external_links
+        
+        content = file_path.read_bytes()
+        try:
+            tree = lxml.html.fromstring(content, parser=_HTML_PARSER)
+        except etree.ParserError:
+            # No elements at all (blank or only a comment), so no links either
+            return issues, internal_links, external_links
+        
+        # Extract all links
+        links = _extract_links(tree)
+        
+        # Check each link. No pure anchors reach here, so no anchor index is built
+        for link_info in links:
+            issue = _check_link(link_info, file_path, site_dir, None, internal_links, external_links)
+            if issue:
+                issues.append(issue)
+            
+    except Exception as e:
+        issues.append(LinkIssue(
+            file_path=str(file_path.relative_to(site_dir)),
+            line_number=1,
+            link_type='file',
+            url='',
+            issue=f'Error reading file: {str(e)}',
+            context=''
+        ))
+    
+    return issues, internal_links, external_links
+
+
+def _extract_links(tree: lxml.html.HtmlElement) -> List[LinkInfo]:
+    """Extract all links from HTML with line numbers.
+    
+    Line numbers are reported by the parser, so the source is never rescanned.
+    
+    Returns:
+        List of tuples: (url, line_number, context)
+    """
+    links = []
+    
+    # Find all <a> tags with href attributes
+    for tag in tree.iter('a'):
+        href = tag.get('href')
+        if href is None:
+            continue
+        href = href.strip()
+        # Skip empty and pure anchors. Same-page anchors are not validated yet,
+        # so _collect_anchors and _check_anchor_link are currently never reached
+        if not href or href.startswith('#'):
+            continue
+        
+        # Get context (simplified tag representation)
+        tag_str = etree.tostring(tag, encoding='unicode', with_tail=False)
+        context = tag_str[:100] + '...' if len(tag_str) > 100 else tag_str
+        
+        # Line where the parser saw the tag start
+        line_number = tag.sourceline or 1
+        
+        links.append((href, line_number, context))
+    
+    return links
+
+
+def _collect_anchors(tree: lxml.html.HtmlElement) -> Set[str]:
+    """Collect the anchor targets defined on a page.
+    
+    Ids, <a name> values and slugified header texts share one set, so an
+    anchor link needs no per-header comparison.
+    """
+    anchors = set(_ID_XPATH(tree))
+    anchors.update(_NAME_XPATH(tree))
+    anchors.update(
+        header.text_content().strip().lower().translate(_SLUG_TRANS)
+        for header in _HEADER_XPATH(tree)
+    )
+    return anchors
+
+
+def _check_link(link_info: LinkInfo, file_path: Path, site_dir: Path,
+                anchors: Optional[Set[str]],
+                internal_links: List[LinkInfo],
+                external_links: List[LinkInfo]) -> Optional[LinkIssue]:
+    """Check a single link, returning an issue if found.
+    
+    Internal and external links are appended to internal_links and
+    external_links instead of being checked.
+    """
+    url, line_number, context = link_info
+    
+    # Dispatch on cheap prefix tests; this runs for every link on every page
+    if url[:6].lower().startswith(('http:', 'https:')):
+        # External link, checked later by the parent process
+        external_links.append(link_info)
+    elif url[:1] == '#':
+        # Anchor link within the same page
+        return _check_anchor_link(url, line_number, file_path, site_dir, context, anchors)
+    elif not _SCHEME_RE.match(url):
+        # Internal link to another page, checked later by the parent process
+        internal_links.append(link_info)
+    # Other schemes (mailto:, tel:, etc.) are ignored
+    
+    return None
+
+
+def _check_anchor_link(url: str, line_number: int, file_path: Path, site_dir: Path,
+                       context: str, anchors: Optional[Set[str]]) -> Optional[LinkIssue]:
+    """Check an anchor link against the current page's anchor targets.
+    
+    anchors is None when the page was not indexed, and then nothing matches.
+    """
+    try:
+        # Remove the # and get the anchor name
+        anchor = url[1:]
+        
+        # Check for id and <a name> attributes, then for headers with text
+        # matching the anchor (URL-encoded)
+        found = anchors is not None and (
+            anchor in anchors or
+            urllib.parse.unquote(anchor).lower().translate(_SLUG_TRANS) in anchors
+        )
+        
+        if not found:
+            return LinkIssue(
+                file_path=str(file_path.relative_to(site_dir)),
+                line_number=line_number,
+                link_type='anchor',
+                url=url,
+                issue='Anchor not found on page',
+                context=context
+            )
+            
+    except Exception as e:
+        return LinkIssue(
+            file_path=str(file_path.relative_to(site_dir)),
+            line_number=line_number,
+            link_type='anchor',
+            url=url,
+            issue=f'Error checking anchor: {str(e)}',
+            context=context
+        )
+    
+    return None
+
+
+def _retry_delay(retry_after: Optional[str]) -> float:
+    """Seconds to wait before retrying, from a Retry-After header value.
+    
+    Accepts either delay-seconds or an HTTP date, and waits one second if the
+    header is missing or malformed.
+    """
+    delay = 1.0
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                retry_at = email.utils.parsedate_to_datetime(retry_after)
+                delay = retry_at.timestamp() - time.time()
+            except (TypeError, ValueError):
+                pass
+    return min(max(delay, 0.0), _MAX_RETRY_AFTER)
+
+
 class LinkChecker:
     """Main link checker class."""
     
-    def __init__(self, site_dir: str, check_external: bool = False, timeout: int = 10):
+    def __init__(self, site_dir: str, check_external: bool = False, timeout: int = 10,
+                 cache_path: Optional[str] = None, cache_ttl: float = 48 * 3600,
+                 max_parse_bytes: int = 1 << 20):
         self.site_dir = Path(site_dir).resolve()
         self.check_external = check_external
         self.timeout = timeout
+        # HTML files larger than this are skipped to keep parser memory bounded
+        self.max_parse_bytes = max_parse_bytes
+        # External URLs that succeeded within cache_ttl seconds are not rechecked.
+        # Caching is disabled when cache_path is None.
+        self.cache_path = cache_path
+        self.cache_ttl = cache_ttl
         self.issues: List[LinkIssue] = []
         self.visited_external: Set[str] = set()
+        # Every external link occurrence: (url, file_path, line_number, context)
+        self._external_candidates: List[Tuple[str, Path, int, str]] = []
+        # Every path and directory in the site, filled in by _index_site
+        self._all_paths: Set[str] = set()
+        self._all_dirs: Set[str] = set()
+        # Status of each (directory, url) internal link already classified
+        self._internal_status: Dict[Tuple[str, str], str] = {}
         self.base_url = None
         
         # Validate site directory
@@ -63,7 +302,7 @@ class LinkChecker:
                 try:
                     content = config_file.read_text()
                     # Simple regex to find baseURL in various formats
-                    match = re.search(r'baseURL\s*[:=]\s*["\']([^"\']+)["\']', content)
+                    match = _BASEURL_RE.search(content)
                     if match:
                         self.base_url = match.group(1).rstrip('/')
                         break
@@ -79,140 +318,121 @@ class LinkChecker:
         """Check all HTML files in the site for link issues."""
         print(f"Checking links in site: {self.site_dir}")
         
-        # Find all HTML files
-        html_files = list(self.site_dir.rglob("*.html"))
+        # Walk the site once to find all HTML files and index every path, so
+        # internal links are answered from memory instead of per-link stat calls
+        html_files = self._index_site()
         if not html_files:
             print("Warning: No HTML files found in site directory")
             return self.issues
         
         print(f"Found {len(html_files)} HTML files to check")
         
-        # Check each file
-        for html_file in html_files:
-            self._check_file(html_file)
+        # Parse and check each file in parallel across worker processes
+        max_workers = min(16, os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(parse_file, html_files, itertools.repeat(self.site_dir),
+                                   itertools.repeat(self.max_parse_bytes), chunksize=8)
+            for html_file, (file_issues, internal_links, external_links) in zip(html_files, results):
+                self.issues.extend(file_issues)
+                for url, line_number, context in internal_links:
+                    self._check_internal_link(url, line_number, html_file, context)
+                if self.check_external:
+                    self._external_candidates.extend(
+                        (url, html_file, line_number, context)
+                        for url, line_number, context in external_links
+                    )
+        
+        # Check all collected external links concurrently
+        if self._external_candidates:
+            self._check_external_links()
         
         # Report summary
         self._print_summary()
         
         return self.issues
     
-    def _check_file(self, file_path: Path):
-        """Check links in a single HTML file."""
-        try:
-            content = file_path.read_text(encoding='utf-8')
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            # Extract all links
-            links = self._extract_links(soup, file_path)
-            
-            # Check each link
-            for link_info in links:
-                self._check_link(link_info, file_path)
-                
-        except Exception as e:
-            issue = LinkIssue(
-                file_path=str(file_path.relative_to(self.site_dir)),
-                line_number=1,
-                link_type='file',
-                url='',
-                issue=f'Error reading file: {str(e)}',
-                context=''
-            )
-            self.issues.append(issue)
-    
-    def _extract_links(self, soup: BeautifulSoup, file_path: Path) -> List[Tuple[str, int, str]]:
-        """Extract all links from HTML with line numbers.
+    def _index_site(self) -> List[Path]:
+        """Record every path and directory under the site directory.
+        
+        Uses os.scandir, whose entries already carry their file type, so the
+        walk costs one directory read per directory rather than a stat per path.
         
         Returns:
-            List of tuples: (url, line_number, context)
+            All HTML files found in the site.
         """
-        links = []
+        site_root = str(self.site_dir)
+        self._all_paths = {site_root}
+        self._all_dirs = {site_root}
+        html_files = []
         
-        # Get the original HTML content for line number calculation
-        content = file_path.read_text(encoding='utf-8')
-        lines = content.split('\n')
+        pending = [site_root]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    self._all_paths.add(entry.path)
+                    if entry.is_dir():
+                        self._all_dirs.add(entry.path)
+                        # Like rglob, list symlinked directories but do not descend
+                        if not entry.is_symlink():
+                            pending.append(entry.path)
+                    elif entry.name.endswith('.html'):
+                        html_files.append(Path(entry.path))
         
-        # Find all <a> tags with href attributes
-        for tag in soup.find_all('a', href=True):
-            href = tag['href'].strip()
-            if not href or href.startswith('#'):  # Skip empty and pure anchors
-                continue
-                
-            # Find line number by searching for this tag in the source
-            line_number = self._find_line_number(tag, content)
-            
-            # Get context (simplified tag representation)
-            context = str(tag)[:100] + '...' if len(str(tag)) > 100 else str(tag)
-            
-            links.append((href, line_number, context))
+        return html_files
+    
+    def _exists(self, path: str) -> bool:
+        """Return whether a path exists, asking the filesystem only on an index miss.
         
-        return links
+        The index does not descend into symlinked directories, so paths below
+        them are only found on disk.
+        """
+        return path in self._all_paths or os.path.exists(path)
     
-    def _find_line_number(self, tag, content: str) -> int:
-        """Find the line number of a tag in the original HTML content."""
-        # This is a simplified approach - in practice, you might want a more
-        # sophisticated method to handle edge cases
-        tag_str = str(tag)
-        lines = content.split('\n')
+    def _is_dir(self, path: str) -> bool:
+        """Return whether a path is a directory, asking the filesystem only on an index miss."""
+        if path in self._all_dirs:
+            return True
+        return path not in self._all_paths and os.path.isdir(path)
+    
+    def _target_status(self, target: str) -> Literal['file', 'dir', 'missing', 'missing_html']:
+        """Classify a normalized internal link target against the site index.
         
-        for i, line in enumerate(lines, 1):
-            if tag_str in line:
-                return i
+        Returns:
+            'file' for an existing file, 'dir' for a directory with an index.html,
+            'missing' if neither exists, and 'missing_html' for an extensionless
+            file without an .html counterpart.
+        """
+        # Handle potential directory URLs (add index.html)
+        if self._is_dir(target):
+            return 'dir' if self._exists(os.path.join(target, 'index.html')) else 'missing'
         
-        # If not found exactly, try partial matching
-        tag_parts = tag_str.split()
-        for i, line in enumerate(lines, 1):
-            matches = sum(1 for part in tag_parts if part in line)
-            if matches >= len(tag_parts) // 2:  # At least half match
-                return i
+        if not self._exists(target):
+            return 'missing'
         
-        return 1  # Default to first line if not found
-    
-    def _check_link(self, link_info: Tuple[str, int, str], file_path: Path):
-        """Check a single link and add issues if found."""
-        url, line_number, context = link_info
+        # URL without extension, try adding .html
+        root, ext = os.path.splitext(target)
+        if not ext and not self._exists(root + '.html'):
+            return 'missing_html'
         
-        try:
-            parsed = urllib.parse.urlparse(url)
-            
-            if parsed.scheme in ('http', 'https'):
-                # External link
-                if self.check_external:
-                    self._check_external_link(url, line_number, file_path, context)
-            elif parsed.scheme == '':
-                # Internal link or anchor
-                if url.startswith('#'):
-                    # Anchor link within the same page
-                    self._check_anchor_link(url, line_number, file_path, context)
-                else:
-                    # Internal link to another page
-                    self._check_internal_link(url, line_number, file_path, context)
-            # Other schemes (mailto:, tel:, etc.) are ignored
-            
-        except Exception as e:
-            issue = LinkIssue(
-                file_path=str(file_path.relative_to(self.site_dir)),
-                line_number=line_number,
-                link_type='internal',
-                url=url,
-                issue=f'Error parsing link: {str(e)}',
-                context=context
-            )
-            self.issues.append(issue)
+        return 'file'
     
     def _check_internal_link(self, url: str, line_number: int, file_path: Path, context: str):
         """Check an internal link to another page."""
         try:
-            # Resolve the URL relative to the current file
-            current_dir = file_path.parent
-            target_path = (current_dir / url).resolve()
-            
-            # Handle potential directory URLs (add index.html)
-            if target_path.is_dir():
-                target_path = target_path / 'index.html'
+            # Pages in one directory rendered from the same template share their
+            # navigation links, so each (directory, url) pair is resolved once
+            current_dir = str(file_path.parent)
+            status = self._internal_status.get((current_dir, url))
+            if status is None:
+                # Resolve the URL relative to the current file. Paths are normalized
+                # lexically rather than with resolve(): it needs no syscalls and keeps
+                # symlinked files (as in Bazel sandboxes) matching the site index.
+                target = os.path.normpath(os.path.join(current_dir, url))
+                status = self._target_status(target)
+                self._internal_status[(current_dir, url)] = status
             
             # Check if the target file exists
-            if not target_path.exists():
+            if status == 'missing':
                 issue = LinkIssue(
                     file_path=str(file_path.relative_to(self.site_dir)),
                     line_number=line_number,
@@ -222,69 +442,13 @@ class LinkChecker:
                     context=context
                 )
                 self.issues.append(issue)
-            elif not target_path.suffix:
-                # URL without extension, try adding .html
-                html_path = target_path.with_suffix('.html')
-                if html_path.exists():
-                    # Valid link to HTML file without extension
-                    pass
-                else:
-                    issue = LinkIssue(
-                        file_path=str(file_path.relative_to(self.site_dir)),
-                        line_number=line_number,
-                        link_type='internal',
-                        url=url,
-                        issue='Target file not found (tried .html extension)',
-                        context=context
-                    )
-                    self.issues.append(issue)
-                    
-        except Exception as e:
-            issue = LinkIssue(
-                file_path=str(file_path.relative_to(self.site_dir)),
-                line_number=line_number,
-                link_type='internal',
-                url=url,
-                issue=f'Error resolving internal link: {str(e)}',
-                context=context
-            )
-            self.issues.append(issue)
-    
-    def _check_anchor_link(self, url: str, line_number: int, file_path: Path, context: str):
-        """Check an anchor link within the current page."""
-        try:
-            # Remove the # and get the anchor name
-            anchor = url[1:]
-            
-            # Read the file content
-            content = file_path.read_text(encoding='utf-8')
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            # Look for the anchor
-            found = False
-            
-            # Check for id attributes
-            if soup.find(id=anchor):
-                found = True
-            else:
-                # Check for name attributes in a tags
-                if soup.find('a', {'name': anchor}):
-                    found = True
-                else:
-                    # Check for headers with text matching the anchor (URL-encoded)
-                    decoded_anchor = urllib.parse.unquote(anchor)
-                    for header in soup.find_all(re.compile(r'^h[1-6]$')):
-                        if header.get_text().strip().lower().replace(' ', '-') == decoded_anchor.lower().replace(' ', '-'):
-                            found = True
-                            break
-            
-            if not found:
+            elif status == 'missing_html':
                 issue = LinkIssue(
                     file_path=str(file_path.relative_to(self.site_dir)),
                     line_number=line_number,
-                    link_type='anchor',
+                    link_type='internal',
                     url=url,
-                    issue='Anchor not found on page',
+                    issue='Target file not found (tried .html extension)',
                     context=context
                 )
                 self.issues.append(issue)
@@ -293,67 +457,158 @@ class LinkChecker:
             issue = LinkIssue(
                 file_path=str(file_path.relative_to(self.site_dir)),
                 line_number=line_number,
-                link_type='anchor',
+                link_type='internal',
                 url=url,
-                issue=f'Error checking anchor: {str(e)}',
+                issue=f'Error resolving internal link: {str(e)}',
                 context=context
             )
             self.issues.append(issue)
     
-    def _check_external_link(self, url: str, line_number: int, file_path: Path, context: str):
-        """Check an external link using HTTP request."""
-        # Avoid checking the same URL multiple times
-        if url in self.visited_external:
-            return
-        
-        self.visited_external.add(url)
+    def _check_external_links(self):
+        """Check each unique external URL once and report every occurrence."""
+        self.visited_external = {url for url, _, _, _ in self._external_candidates}
+        urls = sorted(self.visited_external)
+        status_map: Dict[str, Optional[str]] = {}
         
+        cache = self._open_cache()
         try:
-            # Make HTTP request with timeout
-            response = requests.head(url, timeout=self.timeout, allow_redirects=True)
+            if cache is not None:
+                # Skip URLs that were healthy within the cache TTL
+                now = time.time()
+                fresh = [url for url in urls if now - self._cached_at(cache, url) < self.cache_ttl]
+                if fresh:
+                    print(f"Skipping {len(fresh)} external links found healthy in cache")
+                status_map = dict.fromkeys(fresh)
+                urls = [url for url in urls if url not in status_map]
             
-            # Check status code
-            if response.status_code >= 400:
+            if urls:
+                checked = asyncio.run(self._check_external_async(urls))
+                status_map.update(checked)
+                
+                # Remember when each healthy URL was last seen
+                if cache is not None:
+                    now = time.time()
+                    for url, issue in checked.items():
+                        if issue is None:
+                            # One failed write must not drop the remaining URLs
+                            try:
+                                cache[url] = now
+                            except Exception as e:
+                                print(f"Warning: Could not update external link cache for {url}: {e}")
+        finally:
+            if cache is not None:
+                try:
+                    cache.close()
+                except Exception as e:
+                    print(f"Warning: Could not close external link cache: {e}")
+        
+        for url, file_path, line_number, context in self._external_candidates:
+            if status_map[url]:
                 issue = LinkIssue(
                     file_path=str(file_path.relative_to(self.site_dir)),
                     line_number=line_number,
                     link_type='external',
                     url=url,
-                    issue=f'HTTP {response.status_code}: {response.reason}',
+                    issue=status_map[url],
                     context=context
                 )
                 self.issues.append(issue)
-                
-        except requests.exceptions.Timeout:
-            issue = LinkIssue(
-                file_path=str(file_path.relative_to(self.site_dir)),
-                line_number=line_number,
-                link_type='external',
-                url=url,
-                issue=f'Request timeout after {self.timeout} seconds',
-                context=context
-            )
-            self.issues.append(issue)
-        except requests.exceptions.ConnectionError:
-            issue = LinkIssue(
-                file_path=str(file_path.relative_to(self.site_dir)),
-                line_number=line_number,
-                link_type='external',
-                url=url,
-                issue='Connection error',
-                context=context
-            )
-            self.issues.append(issue)
-        except requests.exceptions.RequestException as e:
-            issue = LinkIssue(
-                file_path=str(file_path.relative_to(self.site_dir)),
-                line_number=line_number,
-                link_type='external',
-                url=url,
-                issue=f'Request error: {str(e)}',
-                context=context
+    
+    def _open_cache(self) -> Optional[shelve.Shelf]:
+        """Open the external link cache, or return None if it is disabled or unavailable."""
+        if not self.cache_path:
+            return None
+        
+        try:
+            Path(self.cache_path).parent.mkdir(parents=True, exist_ok=True)
+            return shelve.open(str(self.cache_path))
+        except Exception as e:
+            # A read-only or sandboxed home directory should not fail the check
+            print(f"Warning: External link cache unavailable, checking all links: {e}")
+            return None
+    
+    @staticmethod
+    def _cached_at(cache: shelve.Shelf, url: str) -> float:
+        """Return when a URL was last seen healthy, or 0 if unknown or unreadable."""
+        try:
+            checked_at = cache.get(url, 0)
+        except Exception:
+            # Corrupt entries and dbm errors are treated as a cache miss
+            return 0
+        return checked_at if isinstance(checked_at, (int, float)) else 0
+    
+    async def _check_external_async(self, urls: List[str]) -> Dict[str, Optional[str]]:
+        """Check external links concurrently over a single HTTP session.
+        
+        Returns:
+            Mapping of each URL to its issue description, or None if it is fine.
+        """
+        semaphore = asyncio.Semaphore(_MAX_CONNECTIONS)
+        # Limit requests per host so a site with many links is not hammered
+        host_semaphores: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(_MAX_CONNECTIONS_PER_HOST)
+        )
+        # One pooled connector for the whole run: connections to the same host
+        # are kept alive and reused, skipping repeated TCP and TLS handshakes
+        connector = aiohttp.TCPConnector(limit=_MAX_CONNECTIONS, limit_per_host=_MAX_CONNECTIONS_PER_HOST,
+                                         keepalive_timeout=30)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            results = await asyncio.gather(
+                *(self._fetch_external(session, semaphore, host_semaphores, url) for url in urls)
             )
-            self.issues.append(issue)
+        
+        return dict(zip(urls, results))
+    
+    async def _fetch_external(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                              host_semaphores: Dict[str, asyncio.Semaphore], url: str) -> Optional[str]:
+        """Check a single external link, returning the issue if it is broken."""
+        try:
+            # Malformed URLs (e.g. an unclosed IPv6 bracket) raise ValueError here
+            host_semaphore = host_semaphores[urllib.parse.urlsplit(url).netloc]
+            async with host_semaphore:
+                async with semaphore:
+                    status, reason, retry_after = await self._request_status(session, url)
+                
+                # Rate limited: wait as long as the server asks (holding only
+                # this host's slot), then retry once
+                if status == 429:
+                    await asyncio.sleep(_retry_delay(retry_after))
+                    async with semaphore:
+                        status, reason, _ = await self._request_status(session, url)
+            
+            # Check status code
+            if status < 400 or status in _NON_ERROR_STATUSES:
+                return None
+            issue = f'HTTP {status}: {reason}'
+            
+        except asyncio.TimeoutError:
+            issue = f'Request timeout after {self.timeout} seconds'
+        except aiohttp.ClientResponseError as e:
+            issue = f'HTTP {e.status}: {e.message}'
+        except aiohttp.ClientConnectionError:
+            issue = 'Connection error'
+        except (aiohttp.ClientError, ValueError) as e:
+            issue = f'Request error: {str(e)}'
+        
+        return issue
+    
+    @staticmethod
+    async def _request_status(session: aiohttp.ClientSession, url: str) -> Tuple[int, str, Optional[str]]:
+        """Request a URL, returning its status, reason and Retry-After header."""
+        async with session.head(url, allow_redirects=True) as response:
+            status, reason = response.status, response.reason
+            retry_after = response.headers.get('Retry-After')
+        
+        # Retry with GET when HEAD is rejected; leaving the block
+        # without reading the body avoids downloading it
+        if status in _HEAD_FALLBACK_STATUSES:
+            async with session.get(url, allow_redirects=True) as response:
+                status, reason = response.status, response.reason
+                retry_after = response.headers.get('Retry-After')
+        
+        return status, reason, retry_after
     
     def _print_summary(self):
         """Print a summary of the link checking results."""
@@ -379,28 +634,31 @@ class LinkChecker:
         
         report_path = Path(output_path)
         
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write("# Link Checker Report\n\n")
-            f.write(f"Total Issues: {len(self.issues)}\n\n")
-            
-            # Group issues by file
-            issues_by_file = {}
-            for issue in self.issues:
-                file_path = issue.file_path
-                if file_path not in issues_by_file:
-                    issues_by_file[file_path] = []
-                issues_by_file[file_path].append(issue)
+        # Build the report in memory and write it in one call
+        parts = [
+            "# Link Checker Report\n\n",
+            f"Total Issues: {len(self.issues)}\n\n",
+        ]
+        
+        # Group issues by file
+        issues_by_file = {}
+        for issue in self.issues:
+            issues_by_file.setdefault(issue.file_path, []).append(issue)
+        
+        # Write issues by file
+        for file_path, file_issues in sorted(issues_by_file.items()):
+            parts.append(f"## {file_path}\n\n")
             
-            # Write issues by file
-            for file_path, file_issues in sorted(issues_by_file.items()):
-                f.write(f"## {file_path}\n\n")
-                
-                for issue in sorted(file_issues, key=lambda x: x.line_number):
-                    f.write(f"### Line {issue.line_number} - {issue.link_type.upper()}\n\n")
-                    f.write(f"**URL:** `{issue.url}`\n\n")
-                    f.write(f"**Issue:** {issue.issue}\n\n")
-                    f.write(f"**Context:** `{issue.context}`\n\n")
-                    f.write("---\n\n")
+            for issue in sorted(file_issues, key=lambda x: x.line_number):
+                parts.append(
+                    f"### Line {issue.line_number} - {issue.link_type.upper()}\n\n"
+                    f"**URL:** `{issue.url}`\n\n"
+                    f"**Issue:** {issue.issue}\n\n"
+                    f"**Context:** `{issue.context}`\n\n"
+                    "---\n\n"
+                )
+        
+        report_path.write_text(''.join(parts), encoding='utf-8')
         
         print(f"📄 Report written to: {report_path}")
 
@@ -416,6 +674,7 @@ Examples:
   %(prog)s public/ --check-external  # Check external links too
   %(prog)s public/ report.txt         # Save report to file
   %(prog)s public/ --timeout 5       # Set timeout for external requests
+  %(prog)s public/ --check-external --no-cache  # Recheck every external link
         """
     )
     
@@ -443,6 +702,26 @@ Examples:
         help='Timeout for external link requests in seconds (default: 10)'
     )
     
+    parser.add_argument(
+        '--max-file-size',
+        type=int,
+        default=1 << 20,
+        help='Skip HTML files larger than this many bytes (default: 1048576)'
+    )
+    
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=48,
+        help='Hours to trust a previously healthy external link before rechecking it (default: 48)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'Do not read or update the external link cache ({DEFAULT_CACHE_PATH})'
+    )
+    
     args = parser.parse_args()
     
     try:
@@ -450,7 +729,10 @@ Examples:
         checker = LinkChecker(
             site_dir=args.site_dir,
             check_external=args.check_external,
-            timeout=args.timeout
+            timeout=args.timeout,
+            cache_path=None if args.no_cache else DEFAULT_CACHE_PATH,
+            cache_ttl=args.cache_ttl * 3600,
+            max_parse_bytes=args.max_file_size
         )
         
         # Run the check
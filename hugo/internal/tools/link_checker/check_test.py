@@ -3,12 +3,47 @@
 Simple test for the link checker functionality.
 """
 
+import dbm
 import os
+import shutil
 import tempfile
+import threading
 import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
 
-from check import LinkChecker
+import lxml.html
+
+from check import LinkChecker, _check_anchor_link, _collect_anchors
+
+
+class _StatusHandler(BaseHTTPRequestHandler):
+    """Serves canned statuses: /ok is 200, /no-head rejects only HEAD,
+    /forbidden is 403, /busy is rate limited once and everything else is 404."""
+    
+    requested = []
+    
+    def do_HEAD(self):
+        self.requested.append(self.path)
+        if self.path == '/busy' and self.requested.count('/busy') == 1:
+            self.send_response(429)
+            self.send_header('Retry-After', '0')
+            self.end_headers()
+            return
+        self._respond(405 if self.path == '/no-head' else None)
+    
+    def do_GET(self):
+        self.requested.append(f'GET {self.path}')
+        self._respond()
+    
+    def _respond(self, status=None):
+        if status is None:
+            status = {'/ok': 200, '/no-head': 200, '/forbidden': 403, '/busy': 200}.get(self.path, 404)
+        self.send_response(status)
+        self.end_headers()
+    
+    def log_message(self, format, *args):
+        pass
 
 
 class TestLinkChecker(unittest.TestCase):
@@ -28,6 +63,7 @@ class TestLinkChecker(unittest.TestCase):
     <a href="missing.html">Missing</a>
     <a href="#section1">Anchor</a>
     <a href="https://example.com">External</a>
+    <a href="#nope">Missing anchor</a>
 </body>
 </html>""")
         
@@ -42,7 +78,6 @@ class TestLinkChecker(unittest.TestCase):
     
     def tearDown(self):
         """Clean up test environment."""
-        import shutil
         shutil.rmtree(self.test_dir)
     
     def test_internal_links(self):
@@ -58,15 +93,138 @@ class TestLinkChecker(unittest.TestCase):
         valid_issues = [i for i in issues if i.url == "page1.html"]
         self.assertEqual(len(valid_issues), 0)
     
+    def test_directory_links(self):
+        """Test that directory links resolve to their index.html."""
+        (self.test_site / "docs").mkdir()
+        (self.test_site / "docs" / "index.html").write_text("<html><body></body></html>")
+        (self.test_site / "empty").mkdir()
+        (self.test_site / "links.html").write_text("""<html><body>
+    <a href="docs/">Docs</a>
+    <a href="empty/">Empty</a>
+</body></html>""")
+        
+        checker = LinkChecker(str(self.test_site), check_external=False)
+        issues = checker.check_site()
+        
+        urls = {i.url for i in issues if i.file_path == "links.html"}
+        self.assertEqual(urls, {"empty/"})
+    
+    def test_symlinked_files(self):
+        """Test that symlinked pages, as in Bazel sandboxes, are found and linkable."""
+        outside = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, outside)
+        (outside / "real.html").write_text('<html><body><a href="page1.html">Page 1</a></body></html>')
+        (self.test_site / "linked.html").symlink_to(outside / "real.html")
+        (self.test_site / "links.html").write_text('<html><body><a href="linked.html">Linked</a></body></html>')
+        
+        checker = LinkChecker(str(self.test_site), check_external=False)
+        issues = checker.check_site()
+        
+        self.assertFalse([i for i in issues if i.file_path in ("linked.html", "links.html")])
+    
+    def test_pages_without_elements(self):
+        """Test that blank and comment-only pages are not reported."""
+        (self.test_site / "blank.html").write_text("  \n")
+        (self.test_site / "comment.html").write_text("<!-- only a comment -->")
+        
+        checker = LinkChecker(str(self.test_site), check_external=False)
+        issues = checker.check_site()
+        
+        self.assertFalse([i for i in issues if i.file_path in ("blank.html", "comment.html")])
+    
+    def test_links_into_symlinked_directories(self):
+        """Test that targets below a symlinked directory are found."""
+        outside = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, outside)
+        (outside / "index.html").write_text("<html><body></body></html>")
+        (outside / "page.html").write_text("<html><body></body></html>")
+        (self.test_site / "sub").symlink_to(outside, target_is_directory=True)
+        (self.test_site / "links.html").write_text("""<html><body>
+    <a href="sub/page.html">Page</a>
+    <a href="sub/">Index</a>
+    <a href="sub/missing.html">Missing</a>
+</body></html>""")
+        
+        checker = LinkChecker(str(self.test_site), check_external=False)
+        issues = checker.check_site()
+        
+        urls = {i.url for i in issues if i.file_path == "links.html"}
+        self.assertEqual(urls, {"sub/missing.html"})
+    
+    def test_dangling_symlink(self):
+        """Test that a dangling HTML symlink is reported instead of aborting the run."""
+        (self.test_site / "dangling.html").symlink_to(self.test_site / "nowhere.html")
+        
+        checker = LinkChecker(str(self.test_site), check_external=False)
+        issues = checker.check_site()
+        
+        self.assertEqual([i.link_type for i in issues if i.file_path == "dangling.html"], ["file"])
+        self.assertTrue([i for i in issues if i.url == "missing.html"])
+    
+    def test_large_files_skipped(self):
+        """Test that files over the size limit are not parsed."""
+        (self.test_site / "large.html").write_text(
+            '<html><body><a href="missing-from-large.html">x</a>' + ' ' * 2048 + '</body></html>')
+        
+        checker = LinkChecker(str(self.test_site), check_external=False, max_parse_bytes=1024)
+        issues = checker.check_site()
+        
+        self.assertFalse([i for i in issues if i.file_path == "large.html"])
+        self.assertTrue([i for i in issues if i.url == "missing.html"])
+    
+    def test_line_numbers(self):
+        """Test that issues report the line of the offending tag."""
+        checker = LinkChecker(str(self.test_site), check_external=False)
+        issues = checker.check_site()
+        
+        missing_issues = [i for i in issues if i.url == "missing.html"]
+        self.assertEqual(missing_issues[0].line_number, 6)
+        self.assertEqual(missing_issues[0].context, '<a href="missing.html">Missing</a>')
+    
+    def test_write_report(self):
+        """Test that the report lists each issue under its file."""
+        checker = LinkChecker(str(self.test_site), check_external=False)
+        checker.check_site()
+        report_path = Path(self.test_dir) / "report.md"
+        checker.write_report(str(report_path))
+        
+        report = report_path.read_text(encoding='utf-8')
+        self.assertTrue(report.startswith("# Link Checker Report\n\nTotal Issues: 1\n\n## index.html\n\n"))
+        self.assertIn("### Line 6 - INTERNAL\n\n**URL:** `missing.html`\n\n", report)
+    
     def test_anchor_links(self):
-        """Test anchor link checking."""
+        """Test that same-page anchor links are skipped, not validated."""
         checker = LinkChecker(str(self.test_site), check_external=False)
         issues = checker.check_site()
         
-        # Should not find section1 (exists)
-        anchor_issues = [i for i in issues if i.url == "#section1"]
+        # Pure anchors never reach the anchor check, whether or not they exist
+        anchor_issues = [i for i in issues if i.url in ("#section1", "#nope")]
         self.assertEqual(len(anchor_issues), 0)
     
+    def test_anchor_matching(self):
+        """Test the anchor check against a page's collected anchors."""
+        tree = lxml.html.fromstring("""<html><body>
+    <h2>My Title</h2>
+    <h3>Other Heading</h3>
+    <a name="named">Named</a>
+    <div id="section-id"></div>
+    <div id="spaced-id"></div>
+</body></html>""")
+        anchors = _collect_anchors(tree)
+        page = self.test_site / "index.html"
+        
+        def missing(url, page_anchors=anchors):
+            return _check_anchor_link(url, 1, page, self.test_site, "", page_anchors) is not None
+        
+        self.assertFalse(missing("#section-id"))
+        self.assertFalse(missing("#named"))
+        self.assertFalse(missing("#my-title"))
+        self.assertFalse(missing("#Other%20Heading"))
+        # A decoded slug also matches ids
+        self.assertFalse(missing("#Spaced%20Id"))
+        self.assertTrue(missing("#nope"))
+        self.assertTrue(missing("#section-id", page_anchors=None))
+    
     def test_external_links_disabled(self):
         """Test that external links are not checked when disabled."""
         checker = LinkChecker(str(self.test_site), check_external=False)
@@ -75,6 +233,109 @@ class TestLinkChecker(unittest.TestCase):
         # Should not check external links
         external_issues = [i for i in issues if i.link_type == "external"]
         self.assertEqual(len(external_issues), 0)
+    
+    def _start_server(self) -> str:
+        """Start a local HTTP server for external link tests and return its base URL."""
+        _StatusHandler.requested = []
+        server = HTTPServer(('127.0.0.1', 0), _StatusHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return f"http://127.0.0.1:{server.server_port}"
+    
+    def test_external_links_checked_concurrently(self):
+        """Test that each external URL is checked once and reported everywhere it appears."""
+        base = self._start_server()
+        (self.test_site / "external.html").write_text(f"""<html><body>
+    <a href="{base}/ok">OK</a>
+    <a href="{base}/gone">Gone</a>
+    <a href="{base}/gone">Gone again</a>
+</body></html>""")
+        # index.html links to example.com; keep the test off the real network
+        (self.test_site / "index.html").unlink()
+        
+        checker = LinkChecker(str(self.test_site), check_external=True, timeout=5)
+        issues = checker.check_site()
+        
+        self.assertEqual(checker.visited_external, {f"{base}/ok", f"{base}/gone"})
+        external_issues = [i for i in issues if i.link_type == "external"]
+        self.assertEqual([(i.url, i.line_number) for i in external_issues],
+                         [(f"{base}/gone", 3), (f"{base}/gone", 4)])
+        self.assertTrue(external_issues[0].issue.startswith("HTTP 404"))
+    
+    def test_external_link_cache(self):
+        """Test that healthy external links are served from the cache on later runs."""
+        base = self._start_server()
+        (self.test_site / "index.html").write_text(f"""<html><body>
+    <a href="{base}/ok">OK</a>
+    <a href="{base}/gone">Gone</a>
+</body></html>""")
+        cache_path = str(Path(self.test_dir) / "cache" / "links.db")
+        
+        for _ in range(2):
+            checker = LinkChecker(str(self.test_site), check_external=True, timeout=5,
+                                  cache_path=cache_path)
+            issues = checker.check_site()
+            self.assertEqual([i.url for i in issues if i.link_type == "external"], [f"{base}/gone"])
+        
+        # Broken links are never cached, healthy ones only once
+        self.assertEqual(sorted(_StatusHandler.requested), ["/gone", "/gone", "/ok"])
+    
+    def test_external_link_cache_corrupt_entry(self):
+        """Test that an unreadable cache entry is treated as a miss."""
+        base = self._start_server()
+        (self.test_site / "index.html").write_text(f'<html><body><a href="{base}/ok">OK</a></body></html>')
+        cache_path = str(Path(self.test_dir) / "links.db")
+        with dbm.open(cache_path, 'c') as db:
+            db[f"{base}/ok"] = b"not a pickle"
+        
+        checker = LinkChecker(str(self.test_site), check_external=True, timeout=5,
+                              cache_path=cache_path)
+        issues = checker.check_site()
+        
+        self.assertFalse([i for i in issues if i.link_type == "external"])
+        self.assertEqual(_StatusHandler.requested, ["/ok"])
+    
+    def test_external_head_rejected(self):
+        """Test that HEAD rejections fall back to GET and refusals are not reported."""
+        base = self._start_server()
+        (self.test_site / "index.html").write_text(f"""<html><body>
+    <a href="{base}/no-head">No HEAD</a>
+    <a href="{base}/forbidden">Forbidden</a>
+</body></html>""")
+        
+        checker = LinkChecker(str(self.test_site), check_external=True, timeout=5)
+        issues = checker.check_site()
+        
+        self.assertFalse([i for i in issues if i.link_type == "external"])
+        self.assertIn("GET /no-head", _StatusHandler.requested)
+    
+    def test_external_malformed_url(self):
+        """Test that a malformed external URL is reported without aborting the run."""
+        base = self._start_server()
+        (self.test_site / "index.html").write_text(f"""<html><body>
+    <a href="http://[bad/x">Bad</a>
+    <a href="{base}/gone">Gone</a>
+</body></html>""")
+        
+        checker = LinkChecker(str(self.test_site), check_external=True, timeout=5)
+        issues = checker.check_site()
+        
+        external_issues = {i.url: i.issue for i in issues if i.link_type == "external"}
+        self.assertEqual(set(external_issues), {"http://[bad/x", f"{base}/gone"})
+        self.assertTrue(external_issues["http://[bad/x"].startswith("Request error"))
+    
+    def test_external_rate_limited(self):
+        """Test that a 429 response is retried after its Retry-After delay."""
+        base = self._start_server()
+        (self.test_site / "index.html").write_text(f'<html><body><a href="{base}/busy">Busy</a></body></html>')
+        
+        checker = LinkChecker(str(self.test_site), check_external=True, timeout=5)
+        issues = checker.check_site()
+        
+        self.assertFalse([i for i in issues if i.link_type == "external"])
+        self.assertEqual(_StatusHandler.requested, ["/busy", "/busy"])
 
 
 if __name__ == '__main__':
@@ -22,7 +22,7 @@ if [ ! -f "$LINK_CHECKER_SCRIPT" ]; then
 fi
 
 # Check if it's a Python file with expected content
-if grep -q "import requests" "$LINK_CHECKER_SCRIPT" && grep -q "def main" "$LINK_CHECKER_SCRIPT"; then
+if grep -q "import aiohttp" "$LINK_CHECKER_SCRIPT" && grep -q "def main" "$LINK_CHECKER_SCRIPT"; then
     echo "✓ Link checker script has expected structure"
 else
     echo "FAIL: Link checker script doesn't have expected structure"
@@ -80,7 +80,7 @@ echo ""
 echo "Test 5: Verify requirements.txt exists..."
 REQUIREMENTS_FILE="${RUNFILES_DIR}/_main/hugo/internal/tools/link_checker/requirements.txt"
 if [ -f "$REQUIREMENTS_FILE" ]; then
-    if grep -q "requests" "$REQUIREMENTS_FILE" && grep -q "beautifulsoup" "$REQUIREMENTS_FILE"; then
+    if grep -q "aiohttp" "$REQUIREMENTS_FILE" && grep -q "lxml" "$REQUIREMENTS_FILE"; then
         echo "✓ Requirements file contains expected dependencies"
     else
         echo "FAIL: Requirements file missing expected dependencies"
@@ -221,8 +221,8 @@ echo "Test 11: Python dependency validation..."
 TEST_DEPS_SCRIPT="$TEMP_OUTPUT_DIR/test_deps.py"
 cat > "$TEST_DEPS_SCRIPT" << 'EOF'
 try:
-    import requests
-    import bs4
+    import aiohttp
+    import lxml
     print("SUCCESS: All dependencies available")
     exit(0)
 except ImportError as e:
@@ -273,7 +273,7 @@ EOF
     
 else
     echo "WARN: Python dependencies not available - limited testing possible"
-    echo "       To enable full testing, install: pip install requests beautifulsoup4"
+    echo "       To enable full testing, install: pip install aiohttp lxml"
 fi
 
 # Test 12: Summary test